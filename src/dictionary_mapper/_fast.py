@@ -0,0 +1,156 @@
+"""
+dictionary_mapper._fast.
+
+Hot path of the dictionary mapper: path parsing and compiled plan execution.
+
+This module only uses plain functions and builtin containers so it can be compiled
+with ``hatch run mypyc-build``; the compiled extension module is placed next to it and
+takes precedence on import, otherwise it runs as regular Python. Edits to this file are
+ignored while the extension exists, so run ``hatch run mypyc-clean`` after changing it.
+"""
+
+import sys
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+
+Segment = tuple[str, int | None]
+PlanEntry = tuple[
+    tuple[Segment, ...],
+    tuple[Segment, ...],
+    str,
+    int | None,
+    object,
+    Callable[[object], object] | None,
+]
+
+_PATH_CACHE_SIZE = 4096
+
+
+def _parse_segment(part: str) -> Segment:
+    br = part.find("[")
+    if br > 0 and part[-1] == "]":
+        digits = part[br + 1 : -1]
+        if digits.isdecimal():
+            return sys.intern(part[:br]), int(digits)
+    return sys.intern(part), None
+
+
+@lru_cache(maxsize=_PATH_CACHE_SIZE)  # type: ignore[misc]
+def parse_path(path: str) -> tuple[Segment, ...]:
+    """
+    Split a dotted path into ``(key, index)`` segments.
+
+    Parameters
+    ----------
+    path : str
+        Dotted path, where a segment may address a list item as ``key[index]``.
+
+    Returns
+    -------
+    tuple[Segment, ...]
+        The parsed segments, ``index`` being None for plain keys.
+
+    """
+    return tuple(_parse_segment(part) for part in path.split("."))
+
+
+def _pad_list(lst: list[object], idx: int, value: object) -> None:
+    missing = idx + 1 - len(lst)
+    if isinstance(value, dict):
+        # Every slot needs its own dict, so they cannot be repeated from a single sentinel.
+        lst.extend({} for _ in range(missing))
+        return
+    sentinel: object
+    if isinstance(value, str):
+        sentinel = ""
+    elif isinstance(value, (int, float)):
+        sentinel = -1
+    else:
+        sentinel = None
+    lst.extend([sentinel] * missing)
+
+
+def _list_at(container: dict[str, object], key: str) -> list[object]:
+    existing = container.get(key)
+    if isinstance(existing, list):
+        return existing
+    # A non-list value (e.g. one copied from the source) is replaced, like non-dict parents are.
+    lst: list[object] = []
+    container[key] = lst
+    return lst
+
+
+def apply_plan(plan: list[PlanEntry], source: Mapping[str, object]) -> dict[str, object]:  # noqa: C901, PLR0912
+    """
+    Build a new dictionary from a source dictionary following a compiled plan.
+
+    Parameters
+    ----------
+    plan : list[PlanEntry]
+        Compiled spec entries, applied in order.
+    source : Mapping
+        The source dictionary to read values from; only ``dict`` containers are walked.
+
+    Returns
+    -------
+    dict[str, object]
+        The transformed dictionary.
+
+    """
+    out: dict[str, object] = {}
+    # The source and target walks are inlined so that each entry costs no extra Python frame.
+    for src_parts, dst_parents, dst_key, dst_idx, default, transform in plan:
+        val: object = source if src_parts else default
+        for key, idx in src_parts:
+            if type(val) is dict:
+                try:
+                    val = val[key]
+                except KeyError:
+                    val = None
+            elif isinstance(val, dict):
+                # Subclasses may define __missing__, which subscripting would trigger.
+                val = val.get(key)
+            else:
+                val = default
+                break
+            if idx is not None:
+                if not isinstance(val, list):
+                    val = default
+                    break
+                try:
+                    val = val[idx]
+                except IndexError:
+                    val = default
+                    break
+            if val is None:
+                val = default
+                break
+
+        if transform is not None:
+            try:
+                val = transform(val)
+            except Exception:  # noqa: BLE001
+                val = default
+
+        cur: dict[str, object] = out
+        for key, idx in dst_parents:
+            if idx is not None:
+                lst = _list_at(cur, key)
+                if len(lst) <= idx:
+                    _pad_list(lst, idx, val)
+                nxt = lst[idx]
+                if not isinstance(nxt, dict):
+                    nxt = lst[idx] = {}
+            else:
+                nxt = cur.get(key)
+                if not isinstance(nxt, dict):
+                    nxt = cur[key] = {}
+            cur = nxt
+        if dst_idx is not None:
+            lst = _list_at(cur, dst_key)
+            if len(lst) <= dst_idx:
+                _pad_list(lst, dst_idx, val)
+            lst[dst_idx] = val
+        else:
+            cur[dst_key] = val
+    return out
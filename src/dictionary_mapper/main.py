@@ -4,10 +4,11 @@ dictionary_mapper.
 A tool for mapping and transforming dictionaries based on predefined rules.
 """
 
-import re
-from collections.abc import Callable, Mapping, MutableMapping
+from collections.abc import Callable, Iterable, Mapping
 from typing import TypedDict, cast
 
+from ._fast import PlanEntry, apply_plan, parse_path
+
 
 class TransformationMapping(TypedDict):
     """
@@ -35,60 +36,19 @@ SpecEntry = Mapping[str, str | TransformationMapping]
 class RawDictionaryMapper:
     """A class for mapping raw dictionaries based on predefined rules."""
 
-    def _get_by_path(self, source: dict[str, object], path: str, default: object = None) -> object:
-        cur: object = source if path else default
-        for part in path.split(".") if path else []:
-            m = re.match(r"^([^\[]+)\[(\d+)\]$", part)
-            if m:
-                key, idx = m.group(1), int(m.group(2))
-                cur = cur.get(key, default) if isinstance(cur, dict) else default
-                if not isinstance(cur, list):
-                    cur = default
-                else:
-                    try:
-                        cur = cur[idx]
-                    except IndexError:
-                        cur = default
-            elif isinstance(cur, dict):
-                cur = cur.get(part, default)
-            else:
-                cur = default
-            if cur is None:
-                cur = default
-        return cur
-
-    def _set_by_path(self, dst: MutableMapping[str, object], path: str, value: object) -> None:  # noqa: C901
-        parts = path.split(".")
-        cur = dst
-        for i, part in enumerate(parts):
-            m = re.match(r"^([^\[]+)\[(\d+)\]$", part)
-            is_last = i == len(parts) - 1
-
-            if m:
-                key, idx = m.group(1), int(m.group(2))
-                lst: list[object] = cast("list[object]", cur.setdefault(key, []))
-                while len(lst) <= idx:
-                    if isinstance(value, str):
-                        lst.append("")
-                    elif isinstance(value, (int, float)):
-                        lst.append(-1)
-                    elif isinstance(value, dict):
-                        lst.append({})
-                    else:
-                        lst.append(None)
-                if is_last:
-                    lst[idx] = value
-                    return
-                if not isinstance(lst[idx], dict):
-                    lst[idx] = {}
-                cur = cast("MutableMapping[str, object]", lst[idx])
+    def _compile_spec(self, spec: SpecEntry) -> list[PlanEntry]:
+        plan: list[PlanEntry] = []
+        for entry, target in spec.items():
+            if isinstance(target, str):
+                path, default, transform = target, None, None
             else:
-                if is_last:
-                    cur[part] = value
-                    return
-                if part not in cur or not isinstance(cur[part], dict):
-                    cur[part] = {}
-                cur = cast("MutableMapping[str, object]", cur[part])
+                path, default, transform = target["path"], target["default"], target["transform"]
+                if not callable(transform):
+                    transform = None
+            dst_parts = parse_path(path)
+            dst_key, dst_idx = dst_parts[-1]
+            plan.append((parse_path(entry) if entry else (), dst_parts[:-1], dst_key, dst_idx, default, transform))
+        return plan
 
     def create_transformed_dict(self, source: dict[str, object], spec: SpecEntry) -> dict[str, object]:
         """
@@ -107,30 +67,31 @@ class RawDictionaryMapper:
             The transformed raw dictionary.
 
         """
-        out: MutableMapping[str, object] = {}
+        return apply_plan(self._compile_spec(spec), source)
 
-        for entry, target in spec.items():
-            if isinstance(target, str):
-                path = target
-                default = None
-                transform = None
-            else:
-                path = target["path"]
-                default = target["default"]
-                transform = target["transform"]
-
-            raw_val = self._get_by_path(source, entry, default)
-            if callable(transform):
-                try:
-                    val = transform(raw_val)
-                except Exception:  # noqa: BLE001
-                    val = default
-            else:
-                val = raw_val
+    def create_transformed_dicts(
+        self,
+        sources: Iterable[dict[str, object]],
+        spec: SpecEntry,
+    ) -> list[dict[str, object]]:
+        """
+        Create raw dictionaries for many source dictionaries sharing the same mapping specifications.
 
-            self._set_by_path(out, path, val)
+        Parameters
+        ----------
+        sources : Iterable[dict]
+            The source dictionaries to transform.
+        spec : SpecEntry
+            Specification defining how to map and transform each source dictionary.
 
-        return cast("dict[str, object]", out)
+        Returns
+        -------
+        list[dict[str, object]]
+            The transformed raw dictionaries, in the order of ``sources``.
+
+        """
+        plan = self._compile_spec(spec)
+        return [apply_plan(plan, source) for source in sources]
 
 
 class TypedDictionaryMapper[T: Mapping[str, object]](RawDictionaryMapper):
@@ -154,3 +115,26 @@ class TypedDictionaryMapper[T: Mapping[str, object]](RawDictionaryMapper):
 
         """
         return cast("T", super().create_transformed_dict(source, spec))
+
+    def create_transformed_dicts(  # type: ignore[override]
+        self,
+        sources: Iterable[dict[str, object]],
+        spec: SpecEntry,
+    ) -> list[T]:
+        """
+        Create typed dictionaries for many source dictionaries sharing the same mapping specifications.
+
+        Parameters
+        ----------
+        sources : Iterable[dict]
+            The source dictionaries to transform.
+        spec : SpecEntry
+            Specification defining how to map and transform each source dictionary.
+
+        Returns
+        -------
+        list[T]
+            The transformed typed dictionaries, in the order of ``sources``.
+
+        """
+        return cast("list[T]", super().create_transformed_dicts(sources, spec))
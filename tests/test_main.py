@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import TypedDict, cast
 
 import pytest
@@ -172,3 +173,93 @@ def test_map_raw_dict_to_typed_dict(
     maped_dict: MyTypedDict = dm.create_transformed_dict(src_dict, spec)
 
     common_assertions(cast("dict[str, object]", maped_dict))
+
+
+def test_missing_source_path_returns_default() -> None:
+    dm: RawDictionaryMapper = RawDictionaryMapper()
+    default = {"nested": "not walked"}
+
+    maped_dict = dm.create_transformed_dict(
+        {"body": {}},
+        {"body.missing.nested": {"path": "field", "default": default, "transform": None}},
+    )
+
+    assert maped_dict["field"] is default
+
+
+def test_map_many_raw_dicts_to_typed_dicts(src_dict: dict[str, object], spec: SpecEntry) -> None:
+    dm: TypedDictionaryMapper[MyTypedDict] = TypedDictionaryMapper()
+
+    sources = [src_dict, src_dict]
+
+    maped_dicts: list[MyTypedDict] = dm.create_transformed_dicts(sources, spec)
+
+    assert len(maped_dicts) == len(sources)
+    for maped_dict in maped_dicts:
+        common_assertions(cast("dict[str, object]", maped_dict))
+
+
+def test_map_raw_dict_iterables_to_raw_dicts() -> None:
+    dm: RawDictionaryMapper = RawDictionaryMapper()
+    spec: SpecEntry = {"body.id": "id"}
+    sources: list[dict[str, object]] = [{"body": {"id": i}} for i in range(3)]
+
+    maped_dicts = dm.create_transformed_dicts((source for source in sources), spec)
+
+    assert maped_dicts == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert dm.create_transformed_dicts([], spec) == []
+
+
+def test_spec_entries_are_applied_in_order() -> None:
+    dm: RawDictionaryMapper = RawDictionaryMapper()
+    spec: SpecEntry = {
+        "body.first": {"path": "shared", "default": 0, "transform": lambda x: cast("int", x) * 2},
+        "body.second": "shared",
+        "body.third": "other",
+    }
+
+    maped_dict = dm.create_transformed_dict({"body": {"first": 1, "second": 2, "third": 3}}, spec)
+
+    assert list(maped_dict.items()) == [("shared", 2), ("other", 3)]
+
+
+def test_non_index_bracket_segments_are_plain_keys() -> None:
+    dm: RawDictionaryMapper = RawDictionaryMapper()
+    spec: SpecEntry = {
+        "body.items[]": "items",
+        "body.offset[-1]": "offset[*]",
+    }
+
+    maped_dict = dm.create_transformed_dict({"body": {"items[]": [1, 2], "offset[-1]": 3}}, spec)
+
+    assert maped_dict == {"items": [1, 2], "offset[*]": 3}
+
+
+def test_spec_changes_are_picked_up_between_calls() -> None:
+    dm: RawDictionaryMapper = RawDictionaryMapper()
+    spec: dict[str, str | TransformationMapping] = {"a": "b"}
+
+    assert dm.create_transformed_dict({"a": 1, "c": 2}, spec) == {"b": 1}
+
+    spec["c"] = "d"
+
+    assert dm.create_transformed_dict({"a": 1, "c": 2}, spec) == {"b": 1, "d": 2}
+
+
+def test_non_dict_source_mapping_yields_defaults() -> None:
+    dm: RawDictionaryMapper = RawDictionaryMapper()
+    proxied: dict[str, object] = {"a": 1}
+    source = cast("dict[str, object]", MappingProxyType(proxied))
+
+    assert dm.create_transformed_dict(source, {"a": "b"}) == {"b": None}
+
+
+def test_indexed_target_replaces_non_list_value() -> None:
+    dm: RawDictionaryMapper = RawDictionaryMapper()
+    spec: SpecEntry = {"body.cf": "x", "body.i": "x[0]"}
+    cf: dict[str, object] = {"k": 1}
+
+    maped_dict = dm.create_transformed_dict({"body": {"cf": cf, "i": 2}}, spec)
+
+    assert maped_dict == {"x": [2]}
+    assert cf == {"k": 1}